@@ -6,40 +6,72 @@ Usage:
     analyze_skill.py <path/to/skill>
     analyze_skill.py <path/to/skill> --verbose
     analyze_skill.py <path/to/skill> --json
+    analyze_skill.py <path/to/skills-root> --batch
 
 Examples:
     analyze_skill.py .claude/skills/pdf-editor
     analyze_skill.py .claude/skills/my-skill --verbose
+    analyze_skill.py .claude/skills --batch
 """
 
+import os
 import sys
 import re
 import json
+import argparse
+import multiprocessing as mp
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional, Set
 
 
-def parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
-    """Extract YAML frontmatter and body from SKILL.md content."""
-    if not content.startswith('---'):
-        return {}, content
+_FRONTMATTER_KEYS = {b'name', b'description'}
+_STD_DIRS = {'scripts', 'references', 'assets'}
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return {}, content
+_CODE_BLOCK_RE = re.compile(r'```[\s\S]*?```')
+_DESC_RE = re.compile(
+    r'(?P<trigger>use when|use for|triggers on|use this|should be used)'
+    r'|(?P<verb>\b(?:create|edit|manage|process|handle|generate|analyze|convert|build)\b)',
+    re.IGNORECASE
+)
+_TODO_RE = re.compile(r'\[TODO', re.IGNORECASE)
+_HEADING_RE = re.compile(r'^(#{1,3}) ', re.MULTILINE)
+
+
+def _decode_text(data) -> str:
+    """Decode UTF-8 bytes with universal newlines, as Path.read_text() would."""
+    return str(data, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def parse_frontmatter(data: bytes, keys: Optional[Set[bytes]] = None) -> Tuple[Dict[str, str], str]:
+    """Extract YAML frontmatter and body from raw SKILL.md bytes.
+
+    Only the fields named in ``keys`` are decoded when it is given.
+    """
+    if data.startswith(b'---\n'):
+        start = 4
+    elif data.startswith(b'---\r\n'):
+        start = 5
+    else:
+        return {}, _decode_text(data)
+
+    end = data.find(b'\n---', start - 1)
+    if end == -1:
+        return {}, _decode_text(data)
 
     frontmatter = {}
-    for line in parts[1].strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip()
+    for line in data[start:end].splitlines():
+        key, sep, value = line.partition(b':')
+        key = key.strip()
+        if sep and (keys is None or key in keys):
+            frontmatter[key.decode('utf-8')] = value.strip().decode('utf-8')
 
-    return frontmatter, parts[2].strip()
+    # Decode the body straight from a view to avoid copying it as bytes first
+    return frontmatter, _decode_text(memoryview(data)[end + 4:]).strip()
 
 
 def count_lines(content: str) -> int:
     """Count non-empty lines in content."""
-    return len([line for line in content.split('\n') if line.strip()])
+    return sum(1 for line in content.splitlines() if line.strip())
 
 
 def analyze_description(description: str) -> Dict[str, Any]:
@@ -64,16 +96,23 @@ def analyze_description(description: str) -> Dict[str, Any]:
         suggestions.append('Consider condensing to essential triggers only')
         score -= 10
 
-    # Trigger keywords
-    trigger_patterns = ['use when', 'use for', 'triggers on', 'use this', 'should be used']
-    has_trigger = any(pattern in description.lower() for pattern in trigger_patterns)
+    # Trigger keywords and action verbs, found in a single scan
+    has_trigger = has_verb = False
+    for match in _DESC_RE.finditer(description):
+        if match.lastgroup == 'trigger':
+            has_trigger = True
+        else:
+            has_verb = True
+        if has_trigger and has_verb:
+            break
+
     if not has_trigger:
         issues.append('Missing trigger guidance')
         suggestions.append('Add "Use when..." or similar trigger phrases')
         score -= 20
 
     # Action verbs
-    if not re.search(r'\b(create|edit|manage|process|handle|generate|analyze|convert|build)\b', description.lower()):
+    if not has_verb:
         issues.append('Missing action verbs')
         suggestions.append('Include verbs describing what the skill does')
         score -= 10
@@ -89,7 +128,7 @@ def analyze_description(description: str) -> Dict[str, Any]:
 
 def strip_code_blocks(content: str) -> str:
     """Remove code block contents to avoid false positives."""
-    return re.sub(r'```[\s\S]*?```', '', content)
+    return _CODE_BLOCK_RE.sub('', content)
 
 
 def analyze_structure(body: str) -> Dict[str, Any]:
@@ -98,17 +137,19 @@ def analyze_structure(body: str) -> Dict[str, Any]:
     suggestions = []
     score = 100
 
-    lines = body.split('\n')
     line_count = count_lines(body)
 
     # Strip code blocks before analyzing headings
     body_no_code = strip_code_blocks(body)
-    lines_no_code = body_no_code.split('\n')
 
-    # Extract headings (outside code blocks)
-    headings = [line for line in lines_no_code if line.startswith('#')]
-    h1_count = len([h for h in headings if h.startswith('# ') and not h.startswith('## ')])
-    h2_count = len([h for h in headings if h.startswith('## ') and not h.startswith('### ')])
+    # Count H1/H2 headings (outside code blocks) in a single regex scan
+    h1_count = h2_count = 0
+    for match in _HEADING_RE.finditer(body_no_code):
+        level = len(match.group(1))
+        if level == 1:
+            h1_count += 1
+        elif level == 2:
+            h2_count += 1
 
     # Structure checks
     if h1_count == 0:
@@ -137,12 +178,12 @@ def analyze_structure(body: str) -> Dict[str, Any]:
         score -= 15
 
     # Code blocks
-    code_blocks = len(re.findall(r'```', body)) // 2
+    code_blocks = body.count('```') // 2
     if code_blocks == 0 and line_count > 50:
         suggestions.append('Consider adding code examples')
 
     # TODO detection (outside code blocks)
-    todos = len(re.findall(r'\[TODO', body_no_code, re.IGNORECASE))
+    todos = len(_TODO_RE.findall(body_no_code))
     if todos > 0:
         issues.append(f'{todos} TODO items remaining')
         score -= todos * 5
@@ -159,6 +200,12 @@ def analyze_structure(body: str) -> Dict[str, Any]:
     }
 
 
+def _list_names(dir_path: str) -> List[str]:
+    """List non-hidden entry names in a directory."""
+    with os.scandir(dir_path) as it:
+        return [entry.name for entry in it if not entry.name.startswith('.')]
+
+
 def analyze_resources(skill_path: Path) -> Dict[str, Any]:
     """Analyze skill resources (scripts, references, assets)."""
     resources = {
@@ -170,38 +217,37 @@ def analyze_resources(skill_path: Path) -> Dict[str, Any]:
     issues = []
     suggestions = []
 
-    for item in skill_path.iterdir():
-        if item.name == 'SKILL.md':
-            continue
+    with os.scandir(skill_path) as it:
+        for entry in it:
+            if entry.name == 'SKILL.md':
+                continue
 
-        if item.is_dir():
-            if item.name == 'scripts':
-                resources['scripts'] = list(item.glob('*'))
-            elif item.name == 'references':
-                resources['references'] = list(item.glob('*'))
-            elif item.name == 'assets':
-                resources['assets'] = list(item.glob('*'))
+            if entry.name in _STD_DIRS and entry.is_dir():
+                resources[entry.name] = _list_names(entry.path)
             else:
-                resources['other'].append(item)
-        else:
-            resources['other'].append(item)
+                resources['other'].append(entry.name)
+
+    scripts_count = len(resources['scripts'])
+    references_count = len(resources['references'])
+    assets_count = len(resources['assets'])
+    other_count = len(resources['other'])
 
     # Check for orphaned resources (would need SKILL.md content to verify)
-    total_resources = sum(len(v) for v in resources.values())
+    total_resources = scripts_count + references_count + assets_count + other_count
 
     if resources['other']:
-        issues.append(f"Files outside standard directories: {[f.name for f in resources['other']]}")
+        issues.append(f"Files outside standard directories: {resources['other']}")
         suggestions.append('Move files to scripts/, references/, or assets/')
 
     return {
-        'scripts_count': len(resources['scripts']),
-        'references_count': len(resources['references']),
-        'assets_count': len(resources['assets']),
-        'other_count': len(resources['other']),
+        'scripts_count': scripts_count,
+        'references_count': references_count,
+        'assets_count': assets_count,
+        'other_count': other_count,
         'total': total_resources,
-        'scripts': [f.name for f in resources['scripts']],
-        'references': [f.name for f in resources['references']],
-        'assets': [f.name for f in resources['assets']],
+        'scripts': resources['scripts'],
+        'references': resources['references'],
+        'assets': resources['assets'],
         'issues': issues,
         'suggestions': suggestions
     }
@@ -217,8 +263,7 @@ def analyze_skill(skill_path: Path) -> Dict[str, Any]:
             'error': f'SKILL.md not found in {skill_path}'
         }
 
-    content = skill_md.read_text()
-    frontmatter, body = parse_frontmatter(content)
+    frontmatter, body = parse_frontmatter(skill_md.read_bytes(), _FRONTMATTER_KEYS)
 
     name = frontmatter.get('name', '')
     description = frontmatter.get('description', '')
@@ -274,6 +319,50 @@ def analyze_skill(skill_path: Path) -> Dict[str, Any]:
     }
 
 
+def find_skills(root: Path) -> List[Path]:
+    """Find all skill directories (containing SKILL.md) under root."""
+    skills = []
+    pending = [str(root)]
+
+    while pending:
+        subdirs = []
+        is_skill = False
+        try:
+            with os.scandir(pending.pop()) as it:
+                for entry in it:
+                    # Don't follow symlinked directories; they can form cycles
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    elif entry.name == 'SKILL.md':
+                        is_skill = True
+                        skills.append(Path(entry.path).parent)
+        except PermissionError:
+            continue
+
+        # Skill resources never contain nested skills
+        if not is_skill:
+            pending.extend(subdirs)
+
+    return sorted(skills)
+
+
+def analyze_batch(root: Path) -> int:
+    """Analyze every skill under root in parallel, writing one JSON object per line."""
+    skill_paths = find_skills(root)
+    exit_code = 0
+
+    with mp.Pool() as pool:
+        for analysis in pool.imap(analyze_skill, skill_paths):
+            json.dump(analysis, sys.stdout)
+            sys.stdout.write('\n')
+            if not analysis.get('valid'):
+                exit_code = 1
+            elif analysis['overall_score'] < 50 and exit_code == 0:
+                exit_code = 2
+
+    return exit_code
+
+
 def print_report(analysis: Dict[str, Any], verbose: bool = False) -> None:
     """Print human-readable analysis report."""
     if not analysis.get('valid'):
@@ -323,14 +412,27 @@ def print_report(analysis: Dict[str, Any], verbose: bool = False) -> None:
     print(f"\n{'='*60}\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: analyze_skill.py <path/to/skill> [--verbose] [--json]")
+class _ArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser that exits with 1 on usage errors (2 means a low score)."""
+
+    def error(self, message: str) -> None:
+        self.print_usage(sys.stderr)
+        print(f"{self.prog}: error: {message}", file=sys.stderr)
         sys.exit(1)
 
-    skill_path = Path(sys.argv[1]).resolve()
-    verbose = '--verbose' in sys.argv
-    as_json = '--json' in sys.argv
+
+def main():
+    parser = _ArgumentParser(description='Analyze skill structure and quality.')
+    parser.add_argument('path', help='path to the skill directory')
+    parser.add_argument('--verbose', action='store_true', help='list resource file names')
+    parser.add_argument('--json', action='store_true', help='output analysis as JSON')
+    parser.add_argument('--batch', action='store_true',
+                        help='analyze every skill under path, emitting one JSON object per line')
+    args = parser.parse_args()
+
+    skill_path = Path(args.path).resolve()
+    verbose = args.verbose
+    as_json = args.json
 
     if not skill_path.exists():
         print(f"Error: Path not found: {skill_path}")
@@ -340,10 +442,15 @@ def main():
         print(f"Error: Path is not a directory: {skill_path}")
         sys.exit(1)
 
+    if args.batch:
+        sys.exit(analyze_batch(skill_path))
+
     analysis = analyze_skill(skill_path)
 
     if as_json:
-        print(json.dumps(analysis, indent=2))
+        # Pretty-print for terminals only; pipes get compact output streamed directly
+        json.dump(analysis, sys.stdout, indent=2 if sys.stdout.isatty() else None)
+        sys.stdout.write('\n')
     else:
         print_report(analysis, verbose)
 
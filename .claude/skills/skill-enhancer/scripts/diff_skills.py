@@ -12,29 +12,53 @@ Examples:
     diff_skills.py .claude/skills/old-version .claude/skills/new-version --summary
 """
 
+import os
 import sys
+import stat
 import json
+import argparse
 import difflib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple
+from typing import Dict, List, Any, Tuple, Optional, Set
 
 
-def parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
-    """Extract YAML frontmatter and body from SKILL.md content."""
-    if not content.startswith('---'):
-        return {}, content
+DIFF_PREVIEW_LINES = 50
+COMPARE_WORKERS = 8
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return {}, content
+_STD_DIRS = {'scripts', 'references', 'assets'}
+
+
+def _decode_text(data) -> str:
+    """Decode UTF-8 bytes with universal newlines, as Path.read_text() would."""
+    return str(data, 'utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def parse_frontmatter(data: bytes, keys: Optional[Set[bytes]] = None) -> Tuple[Dict[str, str], str]:
+    """Extract YAML frontmatter and body from raw SKILL.md bytes.
+
+    Only the fields named in ``keys`` are decoded when it is given.
+    """
+    if data.startswith(b'---\n'):
+        start = 4
+    elif data.startswith(b'---\r\n'):
+        start = 5
+    else:
+        return {}, _decode_text(data)
+
+    end = data.find(b'\n---', start - 1)
+    if end == -1:
+        return {}, _decode_text(data)
 
     frontmatter = {}
-    for line in parts[1].strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip()
+    for line in data[start:end].splitlines():
+        key, sep, value = line.partition(b':')
+        key = key.strip()
+        if sep and (keys is None or key in keys):
+            frontmatter[key.decode('utf-8')] = value.strip().decode('utf-8')
 
-    return frontmatter, parts[2].strip()
+    # Decode the body straight from a view to avoid copying it as bytes first
+    return frontmatter, _decode_text(memoryview(data)[end + 4:]).strip()
 
 
 def get_file_list(skill_path: Path) -> Dict[str, List[str]]:
@@ -47,23 +71,26 @@ def get_file_list(skill_path: Path) -> Dict[str, List[str]]:
         'other': []
     }
 
-    for item in skill_path.iterdir():
-        if item.name.startswith('.'):
-            continue
+    with os.scandir(skill_path) as it:
+        for entry in it:
+            if entry.name.startswith('.'):
+                continue
 
-        if item.is_file():
-            files['root'].append(item.name)
-        elif item.is_dir():
-            if item.name in ['scripts', 'references', 'assets']:
-                files[item.name] = [f.name for f in item.iterdir() if not f.name.startswith('.')]
-            else:
-                files['other'].extend([f"{item.name}/{f.name}" for f in item.iterdir()])
+            if entry.is_file():
+                files['root'].append(entry.name)
+            elif entry.is_dir():
+                with os.scandir(entry.path) as sub:
+                    if entry.name in _STD_DIRS:
+                        files[entry.name] = [e.name for e in sub if not e.name.startswith('.')]
+                    else:
+                        files['other'].extend([f"{entry.name}/{e.name}" for e in sub])
 
     return files
 
 
-def diff_text(original: str, enhanced: str, context: int = 3) -> List[str]:
-    """Generate unified diff between two text contents."""
+def diff_text(original: str, enhanced: str, context: int = 3,
+              max_preview: int = DIFF_PREVIEW_LINES) -> Tuple[List[str], int, int]:
+    """Stream a unified diff, returning a capped preview and addition/deletion counts."""
     original_lines = original.splitlines(keepends=True)
     enhanced_lines = enhanced.splitlines(keepends=True)
 
@@ -75,25 +102,43 @@ def diff_text(original: str, enhanced: str, context: int = 3) -> List[str]:
         n=context
     )
 
-    return list(diff)
-
-
-def count_changes(diff_lines: List[str]) -> Dict[str, int]:
-    """Count additions and deletions in diff output."""
+    preview = []
     additions = 0
     deletions = 0
 
-    for line in diff_lines:
+    for line in diff:
+        if len(preview) < max_preview:
+            preview.append(line.rstrip('\n'))
         if line.startswith('+') and not line.startswith('+++'):
             additions += 1
         elif line.startswith('-') and not line.startswith('---'):
             deletions += 1
 
-    return {
-        'additions': additions,
-        'deletions': deletions,
-        'total_changes': additions + deletions
-    }
+    return preview, additions, deletions
+
+
+def files_differ(original: Path, enhanced: Path) -> bool:
+    """Check whether two regular files differ, comparing sizes before contents.
+
+    Entries that are not regular files (e.g. subdirectories) never differ.
+    """
+    orig_stat = original.stat()
+    enh_stat = enhanced.stat()
+    if not (stat.S_ISREG(orig_stat.st_mode) and stat.S_ISREG(enh_stat.st_mode)):
+        return False
+    if orig_stat.st_size != enh_stat.st_size:
+        return True
+    return original.read_bytes() != enhanced.read_bytes()
+
+
+def _compare_pair(pair: Tuple[str, str, Path, Path]) -> Tuple[str, str, bool]:
+    """Check a single (category, filename, original, enhanced) pair for modification."""
+    category, filename, orig_file, enh_file = pair
+    try:
+        is_modified = files_differ(orig_file, enh_file)
+    except OSError:
+        is_modified = False
+    return category, filename, is_modified
 
 
 def compare_skills(original_path: Path, enhanced_path: Path) -> Dict[str, Any]:
@@ -120,11 +165,8 @@ def compare_skills(original_path: Path, enhanced_path: Path) -> Dict[str, Any]:
         return result
 
     # Read and parse both
-    original_content = original_skill.read_text()
-    enhanced_content = enhanced_skill.read_text()
-
-    original_fm, original_body = parse_frontmatter(original_content)
-    enhanced_fm, enhanced_body = parse_frontmatter(enhanced_content)
+    original_fm, original_body = parse_frontmatter(original_skill.read_bytes())
+    enhanced_fm, enhanced_body = parse_frontmatter(enhanced_skill.read_bytes())
 
     # Compare frontmatter
     fm_changes = {}
@@ -144,11 +186,15 @@ def compare_skills(original_path: Path, enhanced_path: Path) -> Dict[str, Any]:
     result['frontmatter_changes'] = fm_changes
 
     # Compare body
-    body_diff = diff_text(original_body, enhanced_body)
-    body_stats = count_changes(body_diff)
+    diff_preview, additions, deletions = diff_text(original_body, enhanced_body)
+    body_stats = {
+        'additions': additions,
+        'deletions': deletions,
+        'total_changes': additions + deletions
+    }
 
     result['body_changes'] = {
-        'diff': ''.join(body_diff) if body_diff else None,
+        'diff': diff_preview or None,
         'statistics': body_stats,
         'original_lines': len([l for l in original_body.split('\n') if l.strip()]),
         'enhanced_lines': len([l for l in enhanced_body.split('\n') if l.strip()])
@@ -164,6 +210,7 @@ def compare_skills(original_path: Path, enhanced_path: Path) -> Dict[str, Any]:
         'modified': {}
     }
 
+    pairs = []
     for category in ['scripts', 'references', 'assets']:
         orig_set = set(original_files.get(category, []))
         enh_set = set(enhanced_files.get(category, []))
@@ -177,21 +224,20 @@ def compare_skills(original_path: Path, enhanced_path: Path) -> Dict[str, Any]:
         if removed:
             file_changes['removed'][category] = list(removed)
 
-        # Check for modifications in common files
-        modified = []
         for filename in common:
-            orig_file = original_path / category / filename
-            enh_file = enhanced_path / category / filename
-
-            if orig_file.exists() and enh_file.exists():
-                try:
-                    if orig_file.read_text() != enh_file.read_text():
-                        modified.append(filename)
-                except:
-                    pass
-
-        if modified:
-            file_changes['modified'][category] = modified
+            pairs.append((
+                category,
+                filename,
+                original_path / category / filename,
+                enhanced_path / category / filename
+            ))
+
+    # Check common files for modifications concurrently (stat/read bound)
+    if pairs:
+        with ThreadPoolExecutor(max_workers=min(len(pairs), COMPARE_WORKERS)) as executor:
+            for category, filename, is_modified in executor.map(_compare_pair, pairs):
+                if is_modified:
+                    file_changes['modified'].setdefault(category, []).append(filename)
 
     result['file_changes'] = file_changes
 
@@ -279,9 +325,8 @@ def print_full_report(result: Dict[str, Any]) -> None:
     print(f"  Removed: -{body['statistics']['deletions']} lines")
 
     if body['diff']:
-        print(f"\n  Diff preview (first 50 lines):")
-        diff_lines = body['diff'].split('\n')[:50]
-        for line in diff_lines:
+        print(f"\n  Diff preview (first {DIFF_PREVIEW_LINES} lines):")
+        for line in body['diff']:
             print(f"    {line}")
 
     # File changes
@@ -311,14 +356,17 @@ def print_full_report(result: Dict[str, Any]) -> None:
 
 
 def main():
-    if len(sys.argv) < 3:
-        print("Usage: diff_skills.py <original> <enhanced> [--summary] [--json]")
-        sys.exit(1)
-
-    original_path = Path(sys.argv[1]).resolve()
-    enhanced_path = Path(sys.argv[2]).resolve()
-    summary_only = '--summary' in sys.argv
-    as_json = '--json' in sys.argv
+    parser = argparse.ArgumentParser(description='Compare two skill versions.')
+    parser.add_argument('original', help='path to the original skill directory')
+    parser.add_argument('enhanced', help='path to the enhanced skill directory')
+    parser.add_argument('--summary', action='store_true', help='print only the change summary')
+    parser.add_argument('--json', action='store_true', help='output comparison as JSON')
+    args = parser.parse_args()
+
+    original_path = Path(args.original).resolve()
+    enhanced_path = Path(args.enhanced).resolve()
+    summary_only = args.summary
+    as_json = args.json
 
     for path, name in [(original_path, 'Original'), (enhanced_path, 'Enhanced')]:
         if not path.exists():
@@ -331,7 +379,9 @@ def main():
         # Remove diff content for cleaner JSON (can be very long)
         if 'body_changes' in result and 'diff' in result['body_changes']:
             result['body_changes']['diff'] = '[diff content omitted]' if result['body_changes']['diff'] else None
-        print(json.dumps(result, indent=2))
+        # Pretty-print for terminals only; pipes get compact output streamed directly
+        json.dump(result, sys.stdout, indent=2 if sys.stdout.isatty() else None)
+        sys.stdout.write('\n')
     elif summary_only:
         print_summary(result)
     else:
@@ -6,185 +6,374 @@ Usage:
     validate_enhancement.py <path/to/skill>
     validate_enhancement.py <path/to/skill> --original <path/to/backup>
     validate_enhancement.py <path/to/skill> --strict
+    validate_enhancement.py <path/to/skill> <path/to/skill> ... [--jobs N]
 
 Examples:
     validate_enhancement.py .claude/skills/pdf-editor
     validate_enhancement.py .claude/skills/my-skill --original /tmp/my-skill-backup
+    validate_enhancement.py .claude/skills/* --jobs 4
 """
 
+import os
 import sys
 import re
+import functools
+import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Any, Tuple, Optional
-
-
-def parse_frontmatter(content: str) -> Tuple[Dict[str, str], str]:
-    """Extract YAML frontmatter and body from SKILL.md content."""
-    if not content.startswith('---'):
-        return {}, content
+from typing import Dict, List, Any, Tuple, Optional, Set, Iterator
+
+
+_TODO_RE = re.compile(r'\[TODO[^\]]*\]', re.IGNORECASE)
+_FILE_REF_RE = re.compile(r'(?:scripts|references|assets)/[\w\-\.]+(?:\.py|\.md|\.txt|\.json|\.yaml|\.sh)?')
+_NAME_TOKEN_RE = re.compile(r'[\w\-.]+')
+_H1_LINE_RE = re.compile(r'# (?!#)')
+_H2_RE = re.compile(r'##\s+(.+)$')
+
+
+# Validators return (code, *args) tuples; messages are only formatted for display
+Error = Tuple[Any, ...]
+
+ERROR_MESSAGES = {
+    'SKILL_MD_MISSING': "SKILL.md not found in {}",
+    'FM_MISSING': "Missing required field: '{}'",
+    'FM_EMPTY': "Field '{}' is empty",
+    'DESC_SHORT': "Description too short (minimum 20 characters)",
+    'FM_UNKNOWN': "Unknown frontmatter field: '{}'",
+    'BODY_SHORT': "Body too short (minimum 10 non-empty lines)",
+    'BODY_LONG': "Body too long ({} lines, maximum 500)",
+    'H1_MISSING': "Missing main heading (H1)",
+    'H1_MULTIPLE': "Multiple H1 headings found ({})",
+    'FENCE_UNCLOSED': "Unclosed code block detected",
+    'TODOS': "{} TODO items still present",
+    'REF_MISSING': "Referenced file not found: {}",
+    'RES_ORPHANED': "Potentially orphaned resource: {}/{}",
+    'ORIGINAL_MISSING': "Original SKILL.md not found: {}",
+    'NAME_CHANGED': "Skill name changed: '{}' → '{}'",
+    'CONTENT_REDUCED': "Significant content reduction: {} → {} lines ({:.1f}% reduction)",
+    'SECTIONS_REMOVED': "Sections removed: {}",
+    'FILES_REMOVED': "Files removed from {}/: {}",
+}
+
+
+def format_error(error: Error) -> str:
+    """Render an error tuple as a message; set arguments are joined with ', '."""
+    code, *args = error
+    args = [', '.join(arg) if isinstance(arg, (set, frozenset)) else arg for arg in args]
+    return ERROR_MESSAGES[code].format(*args)
+
+
+def parse_frontmatter(data: bytes) -> Tuple[Dict[str, str], str]:
+    """Extract YAML frontmatter and body from raw SKILL.md bytes."""
+    if data.startswith(b'---\n'):
+        start = 4
+    elif data.startswith(b'---\r\n'):
+        start = 5
+    else:
+        return {}, data.decode('utf-8')
 
-    parts = content.split('---', 2)
-    if len(parts) < 3:
-        return {}, content
+    end = data.find(b'\n---', start - 1)
+    if end == -1:
+        return {}, data.decode('utf-8')
 
     frontmatter = {}
-    for line in parts[1].strip().split('\n'):
-        if ':' in line:
-            key, value = line.split(':', 1)
-            frontmatter[key.strip()] = value.strip()
+    for line in data[start:end].splitlines():
+        key, sep, value = line.partition(b':')
+        if sep:
+            frontmatter[key.strip().decode('utf-8')] = value.strip().decode('utf-8')
 
-    return frontmatter, parts[2].strip()
+    # Decode the body straight from a view to avoid copying it as bytes first
+    return frontmatter, str(memoryview(data)[end + 4:], 'utf-8').strip()
 
 
-def validate_frontmatter(frontmatter: Dict[str, str]) -> List[str]:
+def validate_frontmatter(frontmatter: Dict[str, str]) -> List[Error]:
     """Validate frontmatter structure and content."""
     errors = []
 
     if 'name' not in frontmatter:
-        errors.append("Missing required field: 'name'")
+        errors.append(('FM_MISSING', 'name'))
     elif not frontmatter['name']:
-        errors.append("Field 'name' is empty")
+        errors.append(('FM_EMPTY', 'name'))
 
     if 'description' not in frontmatter:
-        errors.append("Missing required field: 'description'")
+        errors.append(('FM_MISSING', 'description'))
     elif not frontmatter['description']:
-        errors.append("Field 'description' is empty")
+        errors.append(('FM_EMPTY', 'description'))
     elif len(frontmatter['description']) < 20:
-        errors.append("Description too short (minimum 20 characters)")
+        errors.append(('DESC_SHORT',))
 
     # Check for invalid fields
     valid_fields = {'name', 'description', 'license'}
     for field in frontmatter:
         if field not in valid_fields:
-            errors.append(f"Unknown frontmatter field: '{field}'")
+            errors.append(('FM_UNKNOWN', field))
 
     return errors
 
 
-def strip_code_blocks(content: str) -> str:
-    """Remove code block contents to avoid false positives."""
-    return re.sub(r'```[\s\S]*?```', '', content)
+def _iter_fence_lines(text: str, in_fence: bool = False) -> Iterator[Tuple[str, bool, bool]]:
+    """Yield (line, is_fence, in_fence) for each line, tracking code fences.
+
+    Fence lines toggle the state, and in_fence is the state after the line, so
+    content lines report whether they sit inside a code block. A line that
+    opens and closes on itself (```bash ls```) is not a fence.
+    """
+    for line in text.splitlines():
+        stripped = line.lstrip()
+        is_fence = stripped.startswith('```') and stripped.count('```') == 1
+        if is_fence:
+            in_fence = not in_fence
+        yield line, is_fence, in_fence
+
+
+def _iter_non_code_lines(body: str) -> Iterator[str]:
+    """Yield body lines that sit outside fenced code blocks."""
+    for line, is_fence, in_fence in _iter_fence_lines(body):
+        if not is_fence and not in_fence:
+            yield line
 
 
-def validate_structure(body: str) -> List[str]:
+def validate_structure(body: str) -> List[Error]:
     """Validate SKILL.md body structure."""
     errors = []
 
-    lines = body.split('\n')
-    line_count = len([l for l in lines if l.strip()])
+    # Single pass: count non-empty lines and fences, and scan headings/TODOs
+    # only outside code blocks
+    line_count = 0
+    fence_count = 0
+    h1_count = 0
+    todos = 0
+
+    for line, is_fence, in_fence in _iter_fence_lines(body):
+        if line.strip():
+            line_count += 1
+
+        if is_fence:
+            fence_count += 1
+        elif not in_fence:
+            if _H1_LINE_RE.match(line):
+                h1_count += 1
+            todos += len(_TODO_RE.findall(line))
 
     # Check for minimum content
     if line_count < 10:
-        errors.append("Body too short (minimum 10 non-empty lines)")
+        errors.append(('BODY_SHORT',))
 
     # Check for maximum length
     if line_count > 500:
-        errors.append(f"Body too long ({line_count} lines, maximum 500)")
-
-    # Strip code blocks before analyzing headings
-    body_no_code = strip_code_blocks(body)
-    lines_no_code = body_no_code.split('\n')
+        errors.append(('BODY_LONG', line_count))
 
     # Check heading structure (outside code blocks)
-    headings = [l for l in lines_no_code if l.startswith('#')]
-    h1_headings = [h for h in headings if h.startswith('# ') and not h.startswith('## ')]
-
-    if len(h1_headings) == 0:
-        errors.append("Missing main heading (H1)")
-    elif len(h1_headings) > 1:
-        errors.append(f"Multiple H1 headings found ({len(h1_headings)})")
+    if h1_count == 0:
+        errors.append(('H1_MISSING',))
+    elif h1_count > 1:
+        errors.append(('H1_MULTIPLE', h1_count))
 
     # Check for unclosed code blocks
-    code_block_count = body.count('```')
-    if code_block_count % 2 != 0:
-        errors.append("Unclosed code block detected")
+    if fence_count % 2 != 0:
+        errors.append(('FENCE_UNCLOSED',))
 
     # Check for TODO items (outside code blocks)
-    todos = re.findall(r'\[TODO[^\]]*\]', body_no_code, re.IGNORECASE)
     if todos:
-        errors.append(f"{len(todos)} TODO items still present")
+        errors.append(('TODOS', todos))
 
     return errors
 
 
-def validate_resources(skill_path: Path, body: str) -> List[str]:
+def validate_resources(skill_path: Path, body: str) -> List[Error]:
     """Validate resource files and references."""
     errors = []
 
-    # Strip code blocks before checking references
-    body_no_code = strip_code_blocks(body)
-
-    # Find all file references in body (more precise regex)
-    file_refs = re.findall(r'(?:scripts|references|assets)/[\w\-\.]+(?:\.py|\.md|\.txt|\.json|\.yaml|\.sh)?', body_no_code)
-
-    for ref in file_refs:
-        ref_path = skill_path / ref
-        if not ref_path.exists():
-            errors.append(f"Referenced file not found: {ref}")
-
-    # Check for orphaned resources
+    # List each resource directory once; reused for existence and orphan checks
+    listings = {}
     for subdir in ['scripts', 'references', 'assets']:
         dir_path = skill_path / subdir
-        if dir_path.exists():
-            for file in dir_path.iterdir():
-                if file.name.startswith('.'):
-                    continue
-                rel_path = f"{subdir}/{file.name}"
-                if rel_path not in body and file.name not in body:
-                    errors.append(f"Potentially orphaned resource: {rel_path}")
+        if dir_path.is_dir():
+            with os.scandir(dir_path) as it:
+                listings[subdir] = [entry.name for entry in it]
+
+    on_disk = {f"{subdir}/{name}" for subdir, names in listings.items() for name in names}
+
+    # Find all file references outside code blocks (more precise regex)
+    for line in _iter_non_code_lines(body):
+        for ref in _FILE_REF_RE.findall(line):
+            if ref not in on_disk:
+                errors.append(('REF_MISSING', ref))
+
+    # Check for orphaned resources against every name-like token in the body
+    # (code blocks included); path components are split on '/' so both bare
+    # names and subdir/name references are covered. Names the tokenizer cannot
+    # represent (spaces, '+', '@', ...) fall back to a substring scan.
+    tokens = set()
+    for token in _NAME_TOKEN_RE.findall(body):
+        tokens.add(token)
+        tokens.add(token.rstrip('.'))
+
+    for subdir, names in listings.items():
+        for name in names:
+            if name.startswith('.') or name in tokens:
+                continue
+            if _NAME_TOKEN_RE.fullmatch(name) or name not in body:
+                errors.append(('RES_ORPHANED', subdir, name))
 
     return errors
 
 
-def validate_no_regression(current_path: Path, original_path: Path) -> List[str]:
-    """Compare enhanced skill against original for regressions."""
-    errors = []
+@functools.lru_cache(maxsize=None)
+def _read_and_parse(path: Path, mtime_ns: int, size: int) -> Tuple[Dict[str, str], str]:
+    """Read and parse a SKILL.md file, cached per (path, mtime, size)."""
+    return parse_frontmatter(path.read_bytes())
 
-    current_skill = current_path / 'SKILL.md'
-    original_skill = original_path / 'SKILL.md'
 
-    if not original_skill.exists():
-        return [f"Original SKILL.md not found: {original_skill}"]
+def read_and_parse(path: Path) -> Tuple[Dict[str, str], str]:
+    """Read and parse a SKILL.md file, reusing the cached result while it is unchanged.
+
+    A single stat both validates the cache and detects a missing file
+    (raises FileNotFoundError, or NotADirectoryError if a parent is a file).
+    """
+    st = path.stat()
+    return _read_and_parse(path, st.st_mtime_ns, st.st_size)
+
+
+def _dir_names(dir_path: Path) -> Optional[Set[str]]:
+    """Entry names in a directory, or None if it does not exist."""
+    try:
+        with os.scandir(dir_path) as it:
+            return {entry.name for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+
+
+def _common_prefix_len(a: str, b: str) -> int:
+    """Length of the longest common prefix, found by halving slice compares."""
+    lo, hi = 0, min(len(a), len(b))
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[lo:mid] == b[lo:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
+
+def _common_suffix_len(a: str, b: str, limit: int) -> int:
+    """Length of the longest common suffix, capped at limit characters."""
+    len_a, len_b = len(a), len(b)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if a[len_a - mid:len_a - lo] == b[len_b - mid:len_b - lo]:
+            lo = mid
+        else:
+            hi = mid - 1
+    return lo
+
 
-    current_content = current_skill.read_text()
-    original_content = original_skill.read_text()
+def _common_line_bounds(a: str, b: str) -> Tuple[int, int]:
+    """Return (prefix_end, suffix_len) of the shared whole-line prefix and suffix."""
+    prefix_end = a.rfind('\n', 0, _common_prefix_len(a, b)) + 1
 
-    current_fm, current_body = parse_frontmatter(current_content)
-    original_fm, original_body = parse_frontmatter(original_content)
+    limit = min(len(a), len(b)) - prefix_end
+    suffix_len = _common_suffix_len(a, b, limit)
+    # Start the suffix after a newline so it begins a line on both sides
+    newline = a.find('\n', len(a) - suffix_len)
+    suffix_len = len(a) - newline - 1 if newline != -1 else 0
+
+    return prefix_end, suffix_len
+
+
+def _scan_region(text: str, in_fence: bool = False) -> Tuple[int, Set[str], bool]:
+    """Count non-empty lines and collect H2 titles outside code blocks.
+
+    Returns the line count, the headings and the fence state at the end of text.
+    """
+    line_count = 0
+    headings = set()
+
+    # The loop rebinds in_fence, so it holds the end state afterwards (or the
+    # starting state when text has no lines)
+    for line, is_fence, in_fence in _iter_fence_lines(text, in_fence):
+        if line.strip():
+            line_count += 1
+        if not is_fence and not in_fence:
+            match = _H2_RE.match(line)
+            if match:
+                headings.add(match.group(1))
+
+    return line_count, headings, in_fence
+
+
+def _content_regressions(current_fm: Dict[str, str], current_body: str,
+                         original_fm: Dict[str, str], original_body: str) -> List[Error]:
+    """Compare SKILL.md frontmatter and body against the original for regressions."""
+    errors = []
 
     # Check name hasn't changed unexpectedly
     if current_fm.get('name') != original_fm.get('name'):
-        errors.append(f"Skill name changed: '{original_fm.get('name')}' → '{current_fm.get('name')}'")
+        errors.append(('NAME_CHANGED', original_fm.get('name'), current_fm.get('name')))
+
+    # The shared prefix and suffix (trimmed to whole lines) are identical on both
+    # sides, so scan them once and only scan each differing middle separately
+    prefix_end, suffix_len = _common_line_bounds(original_body, current_body)
+    prefix_lines, prefix_headings, prefix_fence = _scan_region(original_body[:prefix_end])
+    orig_mid_lines, orig_mid_headings, orig_fence = _scan_region(
+        original_body[prefix_end:len(original_body) - suffix_len], prefix_fence)
+    cur_mid_lines, cur_mid_headings, cur_fence = _scan_region(
+        current_body[prefix_end:len(current_body) - suffix_len], prefix_fence)
+
+    suffix = original_body[len(original_body) - suffix_len:]
+    orig_suffix_lines, orig_suffix_headings, _ = _scan_region(suffix, orig_fence)
+    if cur_fence == orig_fence:
+        cur_suffix_lines, cur_suffix_headings = orig_suffix_lines, orig_suffix_headings
+    else:
+        cur_suffix_lines, cur_suffix_headings, _ = _scan_region(suffix, cur_fence)
 
     # Check for major content loss (more than 30% reduction)
-    current_lines = len([l for l in current_body.split('\n') if l.strip()])
-    original_lines = len([l for l in original_body.split('\n') if l.strip()])
+    original_lines = prefix_lines + orig_mid_lines + orig_suffix_lines
+    current_lines = prefix_lines + cur_mid_lines + cur_suffix_lines
 
     if original_lines > 0:
         reduction = (original_lines - current_lines) / original_lines
         if reduction > 0.3:
-            errors.append(f"Significant content reduction: {original_lines} → {current_lines} lines ({reduction*100:.1f}% reduction)")
+            errors.append(('CONTENT_REDUCED', original_lines, current_lines, reduction * 100))
 
     # Check for removed sections
-    original_headings = set(re.findall(r'^##\s+(.+)$', original_body, re.MULTILINE))
-    current_headings = set(re.findall(r'^##\s+(.+)$', current_body, re.MULTILINE))
+    original_headings = prefix_headings | orig_mid_headings | orig_suffix_headings
+    current_headings = prefix_headings | cur_mid_headings | cur_suffix_headings
 
     removed_sections = original_headings - current_headings
     if removed_sections:
-        errors.append(f"Sections removed: {', '.join(removed_sections)}")
+        errors.append(('SECTIONS_REMOVED', removed_sections))
+
+    return errors
+
+
+def validate_no_regression(current_path: Path, current_fm: Dict[str, str], current_body: str,
+                           original_path: Path) -> List[Error]:
+    """Compare enhanced skill against original for regressions."""
+    errors = []
+
+    original_skill = original_path / 'SKILL.md'
+
+    try:
+        original_fm, original_body = read_and_parse(original_skill)
+    except (FileNotFoundError, NotADirectoryError):
+        return [('ORIGINAL_MISSING', original_skill)]
+
+    # Identical SKILL.md content cannot regress; only resources need checking
+    if current_fm != original_fm or current_body != original_body:
+        errors.extend(_content_regressions(current_fm, current_body, original_fm, original_body))
 
     # Check for removed resources
     for subdir in ['scripts', 'references', 'assets']:
-        original_dir = original_path / subdir
-        current_dir = current_path / subdir
+        original_files = _dir_names(original_path / subdir)
 
-        if original_dir.exists():
-            original_files = set(f.name for f in original_dir.iterdir())
-            current_files = set(f.name for f in current_dir.iterdir()) if current_dir.exists() else set()
+        if original_files is not None:
+            current_files = _dir_names(current_path / subdir) or set()
 
             removed_files = original_files - current_files
             if removed_files:
-                errors.append(f"Files removed from {subdir}/: {', '.join(removed_files)}")
+                errors.append(('FILES_REMOVED', subdir, removed_files))
 
     return errors
 
@@ -196,12 +385,13 @@ def validate_skill(skill_path: Path, original_path: Optional[Path] = None, stric
     if not skill_md.exists():
         return {
             'valid': False,
-            'errors': [f'SKILL.md not found in {skill_path}'],
+            'path': str(skill_path),
+            'name': 'unknown',
+            'errors': [('SKILL_MD_MISSING', skill_path)],
             'warnings': []
         }
 
-    content = skill_md.read_text()
-    frontmatter, body = parse_frontmatter(content)
+    frontmatter, body = parse_frontmatter(skill_md.read_bytes())
 
     errors = []
     warnings = []
@@ -223,7 +413,7 @@ def validate_skill(skill_path: Path, original_path: Optional[Path] = None, stric
 
     # Regression check if original provided
     if original_path:
-        reg_errors = validate_no_regression(skill_path, original_path)
+        reg_errors = validate_no_regression(skill_path, frontmatter, body, original_path)
         if strict:
             errors.extend(reg_errors)
         else:
@@ -250,12 +440,12 @@ def print_report(result: Dict[str, Any]) -> None:
     if result['errors']:
         print(f"\n--- Errors ({len(result['errors'])}) ---")
         for error in result['errors']:
-            print(f"  [ERROR] {error}")
+            print(f"  [ERROR] {format_error(error)}")
 
     if result['warnings']:
         print(f"\n--- Warnings ({len(result['warnings'])}) ---")
         for warning in result['warnings']:
-            print(f"  [WARN] {warning}")
+            print(f"  [WARN] {format_error(warning)}")
 
     if result['valid'] and not result['warnings']:
         print("\n  All validations passed.")
@@ -263,29 +453,43 @@ def print_report(result: Dict[str, Any]) -> None:
     print(f"\n{'='*60}\n")
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: validate_enhancement.py <path/to/skill> [--original <path>] [--strict]")
-        sys.exit(1)
-
-    skill_path = Path(sys.argv[1]).resolve()
-    original_path = None
-    strict = '--strict' in sys.argv
+def _validate_one(args: Tuple[Path, Optional[Path], bool]) -> Dict[str, Any]:
+    """Picklable validate_skill wrapper for process pool workers."""
+    skill_path, original_path, strict = args
+    return validate_skill(skill_path, original_path, strict)
 
-    # Parse --original argument
-    if '--original' in sys.argv:
-        idx = sys.argv.index('--original')
-        if idx + 1 < len(sys.argv):
-            original_path = Path(sys.argv[idx + 1]).resolve()
 
-    if not skill_path.exists():
-        print(f"Error: Path not found: {skill_path}")
-        sys.exit(1)
+def main():
+    parser = argparse.ArgumentParser(description='Validate skill enhancements against the original.')
+    parser.add_argument('paths', nargs='+', help='path(s) to the skill directory')
+    parser.add_argument('--original', help='path to the original skill backup')
+    parser.add_argument('--strict', action='store_true', help='treat resource and regression warnings as errors')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+                        help='number of skills to validate in parallel (default: CPU count)')
+    args = parser.parse_args()
+
+    skill_paths = [Path(p).resolve() for p in args.paths]
+    original_path = Path(args.original).resolve() if args.original else None
+    strict = args.strict
+
+    for skill_path in skill_paths:
+        if not skill_path.exists():
+            print(f"Error: Path not found: {skill_path}")
+            sys.exit(1)
+
+    tasks = [(skill_path, original_path, strict) for skill_path in skill_paths]
+
+    if len(tasks) > 1 and args.jobs > 1:
+        with ProcessPoolExecutor(max_workers=min(args.jobs, len(tasks))) as executor:
+            results = list(executor.map(_validate_one, tasks))
+    else:
+        results = [_validate_one(task) for task in tasks]
 
-    result = validate_skill(skill_path, original_path, strict)
-    print_report(result)
+    # Report in submission order so output stays deterministic
+    for result in results:
+        print_report(result)
 
-    sys.exit(0 if result['valid'] else 1)
+    sys.exit(0 if all(result['valid'] for result in results) else 1)
 
 
 if __name__ == "__main__":